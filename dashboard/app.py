@@ -4,14 +4,22 @@ Plotly Dash Application with ML Results Integration
 """
 
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, Patch, callback, no_update
 import dash_bootstrap_components as dbc
+from flask import request
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from flask_caching import Cache
+import orjson
+from functools import cached_property, lru_cache
+import hashlib
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import numpy as np
 from pathlib import Path
+import warnings
 
 # Initialize the Dash app with Bootstrap theme
 app = dash.Dash(
@@ -21,27 +29,153 @@ app = dash.Dash(
     title="Diabetes Dashboard - Complete"
 )
 
-# Load data
+# Dash serializes layouts and callback responses (figures included) through
+# plotly's JSON encoder, so switch that encoder to orjson
+pio.json.config.default_engine = 'orjson'
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, for jsonify responses and request body
+    parsing (e.g. callback payloads); Dash's own responses go through plotly's encoder"""
+    
+    # json.dumps options orjson can reproduce; any other option uses the stdlib provider
+    ORJSON_KWARGS = {'sort_keys', 'indent', 'default'}
+    
+    def __init__(self, app):
+        super().__init__(app)
+        self.fallback = DefaultJSONProvider(app)
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs.keys() - self.ORJSON_KWARGS or kwargs.get('indent') not in (None, 2):
+            return self.fallback.dumps(obj, **kwargs)
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys'):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent') == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', DefaultJSONProvider.default),
+                            option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return self.fallback.loads(s, **kwargs)
+        return orjson.loads(s)
+
+app.server.json = OrjsonProvider(app.server)
+
 BASE_DIR = Path(__file__).parent.parent
-df = pd.read_csv(BASE_DIR / 'data' / 'BASEDIABET.csv')
-models_comparison = pd.read_csv(BASE_DIR / 'reports' / 'all_models_comparison.csv')
-anomaly_results = pd.read_csv(BASE_DIR / 'reports' / 'anomaly_detection_results.csv')
+
+# Code and data files the cached figures are derived from (Parquet copies included)
+SOURCE_FILES = [Path(__file__)] + [
+    BASE_DIR / folder / f"{name}{suffix}"
+    for folder, name in [('data', 'BASEDIABET'), ('reports', 'all_models_comparison'),
+                         ('reports', 'anomaly_detection_results')]
+    for suffix in ['.csv', '.parquet']
+]
+
+def source_version(paths):
+    """Short fingerprint of the files' modification times"""
+    stamps = '-'.join(str(path.stat().st_mtime_ns) for path in paths if path.exists())
+    return hashlib.md5(stamps.encode()).hexdigest()[:12]
+
+# Memoizes filter-driven figure builders, keyed on their arguments
+# (on disk, so every worker process shares the same entries; bounded so the
+# many slider/dropdown combinations can't grow it without limit)
+cache = Cache(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': str(Path(__file__).parent / '.cache'),
+    'CACHE_THRESHOLD': 500,
+    'CACHE_DEFAULT_TIMEOUT': 3600
+})
+CACHE_VERSION = source_version(SOURCE_FILES)
+
+def versioned_name(fname):
+    # Memoize keys carry the source version, so entries pickled before the data was
+    # regenerated or the code redeployed are never served (they just expire)
+    return f"{fname}@{CACHE_VERSION}"
+
+ASSETS_DIR = Path(__file__).parent / 'assets'
+# Server-side route of the assets folder (honours Dash's pathname prefix config)
+ASSETS_ROUTE = f"{app.config.routes_pathname_prefix}{app.config.assets_url_path.strip('/')}/"
+
+def asset_url(filename):
+    """Asset URL versioned by the file's mtime, so regenerated report images get a new URL"""
+    path = ASSETS_DIR / filename
+    version = path.stat().st_mtime_ns if path.exists() else 0
+    return f"{app.get_asset_url(filename)}?v={version}"
+
+@app.server.after_request
+def cache_static_assets(response):
+    # Only URLs built by asset_url carry a version query that changes whenever the
+    # file is regenerated, so only those are safe to cache as immutable
+    if request.path.startswith(ASSETS_ROUTE) and request.args.get('v'):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+# Load data
+
+# Only the columns the pages actually use are materialized
+BASE_COLUMNS = ['age', 'taille', 'poids', 'bmi', 'gaj', 'hba1c', 'type_diabete']
+ANOMALY_DTYPES = {'patient_id': 'int32', 'iso_anomaly': 'int8', 'iso_score': 'float32',
+                  'ocsvm_anomaly': 'int8', 'ocsvm_score': 'float32', 'consensus_anomaly': 'int8'}
+
+def load_table(csv_path, columns=None, dtype=None):
+    """Read the Parquet copy of a CSV (see convert_to_parquet.py), falling back to the CSV itself
+    when there is no copy or the CSV was regenerated after it"""
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.exists() and (not csv_path.exists()
+                                  or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime):
+        table = pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+        return table.astype(dtype) if dtype else table
+    return pd.read_csv(csv_path, usecols=columns, dtype=dtype)
+
+df = load_table(BASE_DIR / 'data' / 'BASEDIABET.csv', columns=BASE_COLUMNS)
+models_comparison = load_table(BASE_DIR / 'reports' / 'all_models_comparison.csv')
+anomaly_results = load_table(BASE_DIR / 'reports' / 'anomaly_detection_results.csv',
+                             columns=list(ANOMALY_DTYPES), dtype=ANOMALY_DTYPES)
 
 # Add derived columns
-df['age_group'] = pd.cut(df['age'], bins=[0, 25, 35, 45, 55, 65, 100], 
-                          labels=['<25', '25-35', '36-45', '46-55', '56-65', '65+'])
-df['bmi_category'] = pd.cut(df['bmi']*10000, bins=[0, 18.5, 25, 30, 35, 100],
-                             labels=['Underweight', 'Normal', 'Overweight', 'Obese', 'Severely Obese'])
-df['diabetes_status'] = df['type_diabete'].map({0: 'Healthy', 1: 'Diabetic'})
-df['bmi_scaled'] = df['bmi'] * 10000
+AGE_BINS = [0, 25, 35, 45, 55, 65, 100]
+AGE_LABELS = ['<25', '25-35', '36-45', '46-55', '56-65', '65+']
+BMI_BINS = [0, 18.5, 25, 30, 35, 100]
+BMI_LABELS = ['Underweight', 'Normal', 'Overweight', 'Obese', 'Severely Obese']
+
+def bin_codes(values, bins):
+    """Category codes for right-closed bins, same intervals as pd.cut (-1 when out of range)"""
+    codes = np.digitize(values, bins[1:-1], right=True).astype(np.int8)
+    codes[~((values > bins[0]) & (values <= bins[-1]))] = -1
+    return codes
+
+bmi_scaled = df['bmi'].to_numpy() * 10000.0
+df['bmi_scaled'] = bmi_scaled
+df['age_group'] = pd.Categorical.from_codes(bin_codes(df['age'].to_numpy(), AGE_BINS), AGE_LABELS, ordered=True)
+df['bmi_category'] = pd.Categorical.from_codes(bin_codes(bmi_scaled, BMI_BINS), BMI_LABELS, ordered=True)
+df['diabetes_status'] = pd.Categorical(df['type_diabete'].map({0: 'Healthy', 1: 'Diabetic'}),
+                                       categories=['Healthy', 'Diabetic'])
+
+# Attach anomaly data (patient_id lines up with df's row index)
+anomaly_cols = ['iso_anomaly', 'iso_score', 'consensus_anomaly']
+df[anomaly_cols] = anomaly_results.set_index('patient_id')[anomaly_cols].reindex(df.index)
+
+# Downcast once so every filter/groupby moves half the bytes
+# (binning above runs on the float64 values so bin edges are unaffected)
+df = df.astype({'age': 'int16', 'bmi': 'float32', 'bmi_scaled': 'float32', 'gaj': 'float32',
+                'hba1c': 'float32', 'iso_score': 'float32', 'type_diabete': 'int8'})
+df[['iso_anomaly', 'consensus_anomaly']] = df[['iso_anomaly', 'consensus_anomaly']].fillna(0).astype('int8')
 
-# Merge anomaly data
-df = df.merge(anomaly_results[['patient_id', 'iso_anomaly', 'iso_score', 'consensus_anomaly']], 
-              left_index=True, right_on='patient_id', how='left')
+# 8-bit copy of the Isolation Forest score for display (256 levels are plenty for a histogram)
+ISO_SCORE_LO = float(anomaly_results['iso_score'].min())
+ISO_SCORE_STEP = (float(anomaly_results['iso_score'].max()) - ISO_SCORE_LO) / 255 or 1.0
+anomaly_results['iso_score_q'] = ((anomaly_results['iso_score'] - ISO_SCORE_LO) / ISO_SCORE_STEP).round().astype('uint8')
 
 # Create temporal data
-df['date'] = pd.date_range(start='2023-01-01', periods=len(df), freq='D')
-df['month'] = df['date'].dt.to_period('M').astype(str)
+dates = pd.date_range(start='2023-01-01', periods=len(df), freq='D')
+df['date'] = dates
+months_idx = dates.year.to_numpy() * 12 + (dates.month.to_numpy() - 1)
+first_month = months_idx.min()
+month_labels = [f"{m // 12}-{m % 12 + 1:02d}" for m in range(first_month, months_idx.max() + 1)]
+df['month'] = pd.Categorical.from_codes(months_idx - first_month, month_labels, ordered=True)
+week_codes, weeks = pd.factorize(dates.to_period('W'), sort=True)
+df['week'] = pd.Categorical.from_codes(week_codes, weeks.astype(str), ordered=True)
 
 # Color schemes
 COLORS = {
@@ -55,6 +189,21 @@ COLORS = {
     'anomaly': '#FF6B6B'
 }
 
+# Overview statistics (inputs never change at runtime)
+OVERVIEW_STATS = {
+    'total': len(df),
+    'diabetic': int((df['type_diabete'] == 1).sum()),
+    'anomalies': int((df['consensus_anomaly'] == 1).sum()),
+    'age_min': float(df['age'].min()),
+    'age_max': float(df['age'].max()),
+    'avg_bmi': float(df['bmi_scaled'].mean()),
+    'avg_gaj': float(df['gaj'].mean()),
+    'avg_hba1c': float(df['hba1c'].mean()),
+}
+_test_metrics = models_comparison[models_comparison['Set'] == 'Test']
+BEST_MODEL = _test_metrics.loc[_test_metrics['f1'].idxmax(), 'Model']
+BEST_F1 = float(_test_metrics['f1'].max())
+
 # ==================== SIDEBAR ====================
 
 sidebar = html.Div(
@@ -142,15 +291,13 @@ app.layout = html.Div([dcc.Location(id='url', refresh=False), sidebar, content])
 
 # ==================== PAGE 0: OVERVIEW ====================
 
+@lru_cache(maxsize=1)
 def create_overview():
-    total_patients = len(df)
-    diabetic = len(df[df['type_diabete'] == 1])
-    anomalies = len(df[df['consensus_anomaly'] == 1]) if 'consensus_anomaly' in df.columns else 0
-    
-    # Get best model
-    test_metrics = models_comparison[models_comparison['Set'] == 'Test']
-    best_model = test_metrics.loc[test_metrics['f1'].idxmax(), 'Model']
-    best_f1 = test_metrics['f1'].max()
+    total_patients = OVERVIEW_STATS['total']
+    diabetic = OVERVIEW_STATS['diabetic']
+    anomalies = OVERVIEW_STATS['anomalies']
+    best_model = BEST_MODEL
+    best_f1 = BEST_F1
     
     return html.Div([
         html.H1("Dashboard Overview", className="mb-4"),
@@ -212,12 +359,12 @@ def create_overview():
                     dbc.CardBody([
                         dbc.Row([
                             dbc.Col([
-                                html.P([html.Strong("Age Range: "), f"{df['age'].min():.0f} - {df['age'].max():.0f} years"]),
-                                html.P([html.Strong("Avg BMI: "), f"{df['bmi_scaled'].mean():.1f}"]),
-                                html.P([html.Strong("Avg GAJ: "), f"{df['gaj'].mean():.1f} mg/dL"]),
+                                html.P([html.Strong("Age Range: "), f"{OVERVIEW_STATS['age_min']:.0f} - {OVERVIEW_STATS['age_max']:.0f} years"]),
+                                html.P([html.Strong("Avg BMI: "), f"{OVERVIEW_STATS['avg_bmi']:.1f}"]),
+                                html.P([html.Strong("Avg GAJ: "), f"{OVERVIEW_STATS['avg_gaj']:.1f} mg/dL"]),
                             ], md=6),
                             dbc.Col([
-                                html.P([html.Strong("Avg HbA1c: "), f"{df['hba1c'].mean():.1f}%"]),
+                                html.P([html.Strong("Avg HbA1c: "), f"{OVERVIEW_STATS['avg_hba1c']:.1f}%"]),
                                 html.P([html.Strong("Diabetic Rate: "), f"{diabetic/total_patients*100:.1f}%"]),
                                 html.P([html.Strong("Records: "), f"{total_patients}"]),
                             ], md=6),
@@ -278,9 +425,47 @@ def create_overview():
 
 # ==================== PAGE 1: PATIENT DISTRIBUTION ====================
 
+# Row positions and values per diabetes status, split once for the histograms
+STATUS_ROWS = {status: np.flatnonzero((df['diabetes_status'] == status).to_numpy())
+               for status in ['Healthy', 'Diabetic']}
+AGE_BY_STATUS = {status: df['age'].to_numpy()[rows] for status, rows in STATUS_ROWS.items()}
+BMI_BY_STATUS = {status: df['bmi_scaled'].to_numpy()[rows] for status, rows in STATUS_ROWS.items()}
+
+# Fixed age edges over the full data, so filtered views only patch the counts
+# (ages are whole years: 3-year bins on half-year edges keep every bin the same width)
+AGE_EDGES = np.arange(df['age'].min() - 0.5, df['age'].max() + 3, 3)
+
+# Layout shared by the per-status charts, built once and copied into each figure
+BASE_LAYOUT = go.Layout(
+    plot_bgcolor='white', legend_title="Status", height=300,
+    colorway=[COLORS['healthy'], COLORS['diabetic']]
+)
+LAYOUT_HIST = go.Layout(BASE_LAYOUT, barmode='overlay', bargap=0, yaxis_title="Count")
+
+def histogram_counts(values, edges):
+    return np.histogram(values, bins=edges)[0].astype(np.int32)
+
+def histogram_bar(values, edges, **kwargs):
+    # Binned in NumPy so only the bin counts go to the browser
+    return go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=histogram_counts(values, edges),
+                  width=np.diff(edges), **kwargs)
+
+def status_histogram(values_by_status, edges, xaxis_title):
+    fig = go.Figure(
+        data=[histogram_bar(values, edges, name=status, opacity=0.7,
+                            marker_color=COLORS[status.lower()])
+              for status, values in values_by_status.items()],
+        layout=LAYOUT_HIST
+    )
+    fig.update_layout(xaxis_title=xaxis_title)
+    return fig
+
+@lru_cache(maxsize=1)
 def create_distribution():
     return html.Div([
         html.H1("Patient Distribution Analysis", className="mb-4"),
+        dcc.Store(id='filter-p1', storage_type='memory'),
+        dcc.Store(id='filtered-summary-p1', storage_type='memory'),
         
         dbc.Card([
             dbc.CardBody([
@@ -364,7 +549,7 @@ def create_distribution():
                 dbc.Card([
                     dbc.CardBody([
                         html.H5("Age Distribution by Diabetes Status"),
-                        dcc.Graph(id='age-distribution-chart')
+                        dcc.Graph(id='age-distribution-chart', figure=status_histogram(AGE_BY_STATUS, AGE_EDGES, "Age"))
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -400,6 +585,7 @@ def create_distribution():
 
 # ==================== PAGE 2: TEMPORAL EVOLUTION ====================
 
+@lru_cache(maxsize=1)
 def create_temporal():
     return html.Div([
         html.H1("Temporal Evolution of Clinical Indicators", className="mb-4"),
@@ -484,6 +670,7 @@ def create_temporal():
 
 # ==================== PAGE 3: RISK CORRELATIONS ====================
 
+@lru_cache(maxsize=1)
 def create_correlations():
     return html.Div([
         html.H1("Risk Factor Correlations", className="mb-4"),
@@ -563,6 +750,7 @@ def create_correlations():
 
 # ==================== PAGE 4: MODELS PERFORMANCE ====================
 
+@lru_cache(maxsize=1)
 def create_models():
     return html.Div([
         html.H1("Machine Learning Models Performance", className="mb-4"),
@@ -634,6 +822,7 @@ def create_models():
 
 # ==================== PAGE 5: XAI EXPLAINABILITY ====================
 
+@lru_cache(maxsize=1)
 def create_explainability():
     img_dir = BASE_DIR / 'reports'
     
@@ -647,8 +836,8 @@ def create_explainability():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-chart-bar me-2"), "SHAP Feature Importance - XGBoost"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/shap_feature_importance_xgb.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('shap_feature_importance_xgb.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -656,8 +845,8 @@ def create_explainability():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-chart-bar me-2"), "SHAP Summary Plot"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/shap_summary_plot_xgb.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('shap_summary_plot_xgb.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -669,8 +858,8 @@ def create_explainability():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-user-check me-2"), "Case 1: True Positive (SHAP)"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/shap_case1_true_positive.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('shap_case1_true_positive.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -678,8 +867,8 @@ def create_explainability():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-user-times me-2"), "Case 2: False Positive (SHAP)"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/shap_case2_false_positive.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('shap_case2_false_positive.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -691,8 +880,8 @@ def create_explainability():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-microscope me-2"), "LIME - Case 1"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/lime_case1_true_positive.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('lime_case1_true_positive.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -700,8 +889,8 @@ def create_explainability():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-microscope me-2"), "LIME - Case 2"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/lime_case2_false_positive.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('lime_case2_false_positive.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -713,8 +902,8 @@ def create_explainability():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-balance-scale me-2"), "SHAP vs LIME Comparison"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/shap_vs_lime_comparison.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('shap_vs_lime_comparison.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=12),
@@ -723,6 +912,7 @@ def create_explainability():
 
 # ==================== PAGE 6: ANOMALY DETECTION ====================
 
+@lru_cache(maxsize=1)
 def create_anomalies():
     return html.Div([
         html.H1("Anomaly Detection", className="mb-4"),
@@ -803,8 +993,8 @@ def create_anomalies():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-chart-area me-2"), "PCA Visualization"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/anomaly_detection_pca_visualization.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('anomaly_detection_pca_visualization.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -812,8 +1002,8 @@ def create_anomalies():
                 dbc.Card([
                     dbc.CardHeader([html.I(className="fas fa-chart-bar me-2"), "Feature Distributions"]),
                     dbc.CardBody([
-                        html.Img(src=f'/assets/anomaly_feature_distributions.png', 
-                                style={'width': '100%', 'height': 'auto'})
+                        html.Img(src=asset_url('anomaly_feature_distributions.png'), 
+                                style={'width': '100%', 'height': 'auto'}, loading='lazy')
                     ])
                 ], className="shadow-sm")
             ], md=6),
@@ -822,89 +1012,291 @@ def create_anomalies():
 
 # ==================== CALLBACKS ====================
 
+# Pathname -> page layout factory (each cached, so a page tree is built once)
+PAGES = {
+    '/distribution': create_distribution,
+    '/temporal': create_temporal,
+    '/correlations': create_correlations,
+    '/models': create_models,
+    '/explainability': create_explainability,
+    '/anomalies': create_anomalies,
+}
+
 @callback(Output('page-content', 'children'), [Input('url', 'pathname')])
 def display_page(pathname):
-    if pathname == '/distribution':
-        return create_distribution()
-    elif pathname == '/temporal':
-        return create_temporal()
-    elif pathname == '/correlations':
-        return create_correlations()
-    elif pathname == '/models':
-        return create_models()
-    elif pathname == '/explainability':
-        return create_explainability()
-    elif pathname == '/anomalies':
-        return create_anomalies()
-    else:
-        return create_overview()
+    return PAGES.get(pathname, create_overview)()
+
+# Filter values offered by the status / age group dropdowns (temporal and correlations pages)
+STATUS_AGE_GROUP_FILTERS = [(status, age_group) for status in ['all', 0, 1] for age_group in ['all'] + AGE_LABELS]
+
+# Sorted row positions for each dropdown value, so filtering intersects small index arrays
+ALL_ROWS = np.arange(len(df))
+IDX_BY_STATUS = {status: np.flatnonzero((df['type_diabete'] == status).to_numpy()) for status in [0, 1]}
+AGE_GROUP_CODES = df['age_group'].cat.codes.to_numpy()
+IDX_BY_AGEGROUP = {age_group: np.flatnonzero(AGE_GROUP_CODES == code) for code, age_group in enumerate(AGE_LABELS)}
+
+def filter_indices(diabetes_status, age_group):
+    indices = ALL_ROWS if diabetes_status == 'all' else IDX_BY_STATUS[diabetes_status]
+    if age_group != 'all':
+        indices = np.intersect1d(indices, IDX_BY_AGEGROUP[age_group], assume_unique=True)
+    return indices
+
+# Only the columns each page reads, so filtered row takes don't copy the whole frame
+TEMPORAL_FRAME = df[['date', 'week', 'month', 'type_diabete', 'gaj', 'hba1c', 'bmi']]
+CORRELATION_FRAME = df[['type_diabete', 'diabetes_status', 'age', 'bmi_scaled', 'gaj', 'hba1c']]
+
+# Variables of the correlation heatmap
+CORR_COLS = ['age', 'taille', 'poids', 'bmi', 'gaj', 'hba1c', 'type_diabete']
+
+# Row order by age, so an age range is a slice (distribution page)
+AGE_ORDER = np.argsort(df['age'].to_numpy(), kind='stable')
+AGE_SORTED = df['age'].to_numpy()[AGE_ORDER]
+
+class DataStore:
+    """Page-specific derived data, built on first use rather than at import"""
+    
+    @cached_property
+    def age_steps(self):
+        return np.unique(df['age'].to_numpy())
+    
+    @cached_property
+    def age_step_starts(self):
+        # Offset of each age step in age order (plus the end), so a step range is a row slice
+        return np.r_[np.searchsorted(AGE_SORTED, self.age_steps), len(df)]
+    
+    @cached_property
+    def category_counts_cumsum(self):
+        # Patient counts by (age, age group, status, BMI category), accumulated over age so any
+        # slider range is two lookups. Slot 0 of the category axes holds rows outside every bin.
+        shape = (len(self.age_steps), len(AGE_LABELS) + 1, 2, len(BMI_LABELS) + 1)
+        cells = np.ravel_multi_index((np.searchsorted(self.age_steps, df['age'].to_numpy()),
+                                      df['age_group'].cat.codes.to_numpy().astype(np.intp) + 1,
+                                      df['type_diabete'].to_numpy(),
+                                      df['bmi_category'].cat.codes.to_numpy().astype(np.intp) + 1), shape)
+        counts = np.bincount(cells, minlength=np.prod(shape)).reshape(shape)
+        # dtype on the cumsum itself, which would otherwise promote int32 back to int64
+        cumulative = np.cumsum(counts, axis=0, dtype=np.int32)
+        return np.concatenate([np.zeros_like(cumulative[:1]), cumulative])
+    
+    @cached_property
+    def temporal_cache(self):
+        # Every (status, age group, period) filter combination, aggregated once
+        cache = {}
+        for status, age_group in STATUS_AGE_GROUP_FILTERS:
+            filtered_df = TEMPORAL_FRAME.iloc[filter_indices(status, age_group)]
+            for period in ['D', 'W', 'M']:
+                cache[(status, age_group, period)] = aggregate_temporal(filtered_df, period)
+        return cache
+    
+    @cached_property
+    def corr_cache(self):
+        # Correlation matrix for every (status, age group) filter combination, from one
+        # contiguous float32 matrix (constant columns, e.g. type_diabete once filtered, give NaN)
+        values = np.ascontiguousarray(df[CORR_COLS].to_numpy(dtype=np.float32))
+        with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return {
+                (status, age_group): np.corrcoef(values[filter_indices(status, age_group)], rowvar=False).astype('float32')
+                for status, age_group in STATUS_AGE_GROUP_FILTERS
+            }
+
+store = DataStore()
 
 # ========== DISTRIBUTION PAGE CALLBACKS ==========
 
+# Dropdown masks built once; the age slider is a searchsorted cut on the age-sorted rows
+MASK_BY_DIABETES = {status: (df['type_diabete'] == status).to_numpy() for status in [0, 1]}
+BMI_CATEGORY_CODES = df['bmi_category'].cat.codes.to_numpy()
+MASK_BY_BMI = {code + 1: BMI_CATEGORY_CODES == code for code in range(len(BMI_LABELS))}
+
+def masked_mean(values, mask):
+    return values[mask].mean() if mask.any() else float('nan')
+
+def distribution_filter(age_range, diabetes_status, bmi_category):
+    """Normalized distribution filter: (age step start, age step end, status code or 'all',
+    BMI category slot or 0 for all). The row mask and the category counts both read it."""
+    lo = int(np.searchsorted(store.age_steps, age_range[0], side='left'))
+    hi = int(np.searchsorted(store.age_steps, age_range[1], side='right'))
+    bmi_slot = 0 if bmi_category == 'all' else BMI_LABELS.index(bmi_category) + 1
+    return lo, hi, diabetes_status, bmi_slot
+
+def filter_mask(lo, hi, diabetes_status, bmi_slot):
+    """Row mask for a normalized distribution filter"""
+    mask = np.zeros(len(df), dtype=bool)
+    mask[AGE_ORDER[store.age_step_starts[lo]:store.age_step_starts[hi]]] = True
+    if diabetes_status != 'all':
+        mask &= MASK_BY_DIABETES[diabetes_status]
+    if bmi_slot:
+        mask &= MASK_BY_BMI[bmi_slot]
+    return mask
+
+def category_counts(lo, hi, diabetes_status, bmi_slot):
+    """(age group slot, status, BMI category slot) counts for a normalized distribution filter"""
+    counts = store.category_counts_cumsum[hi] - store.category_counts_cumsum[lo]
+    if diabetes_status != 'all':
+        counts[:, 1 - diabetes_status] = 0
+    if bmi_slot:
+        counts[:, :, :bmi_slot] = 0
+        counts[:, :, bmi_slot + 1:] = 0
+    return counts
+
 @callback(
+    [Output('filter-p1', 'data'),
+     Output('filtered-summary-p1', 'data')],
+    [Input('age-slider', 'value'),
+     Input('diabetes-filter', 'value'),
+     Input('bmi-filter', 'value')]
+)
+def update_distribution_filter(age_range, diabetes_status, bmi_category):
+    # One normalized filter per change, shared by every chart/KPI on the page
+    distribution = distribution_filter(age_range, diabetes_status, bmi_category)
+    mask = filter_mask(*distribution)
+    
+    summary = {
+        'total': int(mask.sum()),
+        'diabetic': int((mask & MASK_BY_DIABETES[1]).sum()),
+        'avg_age': f"{masked_mean(df['age'].to_numpy(), mask):.1f} years",
+        'avg_bmi': f"{masked_mean(df['bmi_scaled'].to_numpy(), mask):.1f}",
+    }
+    
+    return distribution, summary
+
+# KPI cards are filled in the browser from the summary store
+app.clientside_callback(
+    """
+    function(summary) {
+        return [summary.total, summary.diabetic, summary.avg_age, summary.avg_bmi];
+    }
+    """,
     [Output('total-patients', 'children'),
      Output('diabetic-count', 'children'),
      Output('avg-age', 'children'),
-     Output('avg-bmi', 'children'),
-     Output('age-distribution-chart', 'figure'),
+     Output('avg-bmi', 'children')],
+    [Input('filtered-summary-p1', 'data')]
+)
+
+@callback(
+    [Output('age-distribution-chart', 'figure'),
      Output('bmi-distribution-chart', 'figure'),
      Output('age-group-chart', 'figure'),
      Output('bmi-category-chart', 'figure')],
-    [Input('age-slider', 'value'),
-     Input('diabetes-filter', 'value'),
-     Input('bmi-filter', 'value')]
+    [Input('filter-p1', 'data')]
 )
-def update_distribution(age_range, diabetes_status, bmi_category):
-    filtered_df = df[(df['age'] >= age_range[0]) & (df['age'] <= age_range[1])]
+def update_distribution(distribution):
+    distribution = tuple(distribution)
+    age_counts, fig2 = build_distribution(distribution)
+    fig3, fig4 = build_category_charts(distribution)
     
-    if diabetes_status != 'all':
-        filtered_df = filtered_df[filtered_df['type_diabete'] == diabetes_status]
+    fig1 = Patch()
+    fig1['data'][0]['y'] = age_counts['Healthy']
+    fig1['data'][1]['y'] = age_counts['Diabetic']
     
-    if bmi_category != 'all':
-        filtered_df = filtered_df[filtered_df['bmi_category'] == bmi_category]
+    return fig1, fig2, fig3, fig4
+
+@cache.memoize(make_name=versioned_name)
+def build_distribution(distribution):
+    selected = filter_mask(*distribution)
+    age_counts = {status: histogram_counts(AGE_BY_STATUS[status][selected[rows]], AGE_EDGES)
+                  for status, rows in STATUS_ROWS.items()}
+    bmis = {status: BMI_BY_STATUS[status][selected[rows]] for status, rows in STATUS_ROWS.items()}
     
-    total = len(filtered_df)
-    diabetic = len(filtered_df[filtered_df['type_diabete'] == 1])
-    avg_age = f"{filtered_df['age'].mean():.1f} years"
-    avg_bmi = f"{filtered_df['bmi_scaled'].mean():.1f}"
+    # BMI is re-binned over the filtered range (a single outlier would otherwise
+    # stretch fixed edges until a category filter fits in one or two bins)
+    bmi_values = np.concatenate(list(bmis.values()))
+    bmi_edges = np.histogram_bin_edges(bmi_values[~np.isnan(bmi_values)], bins=30)
+    fig2 = status_histogram(bmis, bmi_edges, "BMI")
     
-    fig1 = px.histogram(
-        filtered_df, x='age', color='diabetes_status',
-        nbins=30, barmode='overlay',
-        color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']},
-        opacity=0.7
-    )
-    fig1.update_layout(xaxis_title="Age", yaxis_title="Count", legend_title="Status", 
-                       plot_bgcolor='white', height=300)
+    return age_counts, fig2
+
+@cache.memoize(make_name=versioned_name)
+def build_category_charts(distribution):
+    counts = category_counts(*distribution)
     
-    fig2 = px.histogram(
-        filtered_df, x='bmi_scaled', color='diabetes_status',
-        nbins=30, barmode='overlay',
-        color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']},
-        opacity=0.7
+    age_group_counts = counts[1:].sum(axis=2, dtype=np.int32)
+    fig3 = go.Figure(
+        data=[go.Bar(x=AGE_LABELS, y=age_group_counts[:, code], name=status,
+                     marker_color=COLORS[status.lower()])
+              for code, status in enumerate(STATUS_ROWS)],
+        layout=BASE_LAYOUT
     )
-    fig2.update_layout(xaxis_title="BMI", yaxis_title="Count", legend_title="Status", 
-                       plot_bgcolor='white', height=300)
+    fig3.update_layout(barmode='stack', xaxis_title="Age Group", yaxis_title="Number of Patients")
     
-    age_group_data = filtered_df.groupby(['age_group', 'diabetes_status']).size().reset_index(name='count')
-    fig3 = px.bar(
-        age_group_data, x='age_group', y='count', color='diabetes_status',
-        color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']},
-        barmode='stack'
+    bmi_counts = counts.sum(axis=(0, 1), dtype=np.int32)[1:]
+    fig4 = go.Figure(
+        data=go.Pie(values=bmi_counts, labels=BMI_LABELS,
+                    marker=dict(colors=px.colors.qualitative.Set3)),
+        layout=go.Layout(height=300)
     )
-    fig3.update_layout(xaxis_title="Age Group", yaxis_title="Number of Patients", 
-                       legend_title="Status", plot_bgcolor='white', height=300)
-    
-    bmi_counts = filtered_df['bmi_category'].value_counts().reset_index()
-    bmi_counts.columns = ['category', 'count']
-    fig4 = px.pie(bmi_counts, values='count', names='category',
-                  color_discrete_sequence=px.colors.qualitative.Set3)
-    fig4.update_layout(height=300)
     
-    return total, diabetic, avg_age, avg_bmi, fig1, fig2, fig3, fig4
+    return fig3, fig4
 
 # ========== TEMPORAL PAGE CALLBACKS ==========
 
+STATUS_LABELS = np.array(['Healthy', 'Diabetic'])
+
+def run_sums(sorted_codes, values):
+    """Per-code row counts and column sums of values, over already sorted codes"""
+    starts = np.r_[0, np.flatnonzero(np.diff(sorted_codes)) + 1]
+    counts = np.diff(np.r_[starts, len(sorted_codes)])
+    return sorted_codes[starts], counts, np.add.reduceat(values, starts, axis=0)
+
+def group_sums(codes, values):
+    """Per-code row counts and column sums of values, in one sorted reduceat pass"""
+    order = np.argsort(codes, kind='stable')
+    return run_sums(codes[order], values[order])
+
+# Period dropdown value -> precomputed time column
+TIME_COLUMNS = {'D': 'date', 'W': 'week', 'M': 'month'}
+
+def aggregate_temporal(filtered_df, period):
+    time_col = TIME_COLUMNS.get(period, 'month')
+    time_values = filtered_df[time_col]
+    
+    if filtered_df.empty:
+        return (time_col, pd.DataFrame(columns=[time_col, 'diabetes_status', 'gaj']),
+                pd.DataFrame(columns=[time_col, 'diabetes_status', 'hba1c']),
+                pd.DataFrame(columns=[time_col, 'gaj', 'hba1c', 'bmi']))
+    
+    time_codes, time_uniques = pd.factorize(time_values, sort=True)
+    time_uniques = np.asarray(time_uniques)
+    values = filtered_df[['gaj', 'hba1c', 'bmi']].to_numpy(dtype=np.float64)
+    
+    # (period, status) groups, then periods alone from the same partial sums
+    keys, counts, sums = group_sums(time_codes * 2 + filtered_df['type_diabete'].to_numpy(), values)
+    means = (sums / counts[:, None]).astype(np.float32)
+    status_data = pd.DataFrame({
+        time_col: time_uniques[keys // 2],
+        'diabetes_status': STATUS_LABELS[keys % 2],
+        'gaj': means[:, 0],
+        'hba1c': means[:, 1],
+    })
+    gaj_data = status_data[[time_col, 'diabetes_status', 'gaj']]
+    hba1c_data = status_data[[time_col, 'diabetes_status', 'hba1c']]
+    
+    # keys come back sorted, so each period's status groups are already adjacent
+    period_keys, _, period_sums = run_sums(keys // 2, np.column_stack([sums, counts]))
+    period_means = (period_sums[:, :3] / period_sums[:, 3:]).astype(np.float32)
+    combined_data = pd.DataFrame({
+        time_col: time_uniques[period_keys],
+        'gaj': period_means[:, 0],
+        'hba1c': period_means[:, 1],
+        'bmi': period_means[:, 2] * 10000,
+    })
+    
+    return time_col, gaj_data, hba1c_data, combined_data
+
+def status_lines(data, time_col, value_col, yaxis_title):
+    # One line trace per diabetes status over the aggregated periods
+    statuses = data['diabetes_status'].to_numpy()
+    return go.Figure(
+        data=[go.Scatter(x=data[time_col].to_numpy()[statuses == status],
+                         y=data[value_col].to_numpy()[statuses == status],
+                         mode='lines+markers', name=status,
+                         line=dict(color=COLORS[status.lower()]))
+              for status in STATUS_LABELS],
+        layout=go.Layout(BASE_LAYOUT, height=350, xaxis_title="Period", yaxis_title=yaxis_title)
+    )
+
 @callback(
     [Output('gaj-evolution-chart', 'figure'),
      Output('hba1c-evolution-chart', 'figure'),
@@ -914,44 +1306,14 @@ def update_distribution(age_range, diabetes_status, bmi_category):
      Input('period-filter', 'value')]
 )
 def update_temporal(diabetes_status, age_group, period):
-    filtered_df = df.copy()
-    
-    if diabetes_status != 'all':
-        filtered_df = filtered_df[filtered_df['type_diabete'] == diabetes_status]
-    
-    if age_group != 'all':
-        filtered_df = filtered_df[filtered_df['age_group'].astype(str) == age_group]
-    
-    if period == 'D':
-        time_col = 'date'
-    elif period == 'W':
-        filtered_df['period'] = filtered_df['date'].dt.to_period('W').astype(str)
-        time_col = 'period'
-    else:
-        time_col = 'month'
-    
-    gaj_data = filtered_df.groupby([time_col, 'diabetes_status'])['gaj'].mean().reset_index()
-    fig1 = px.line(
-        gaj_data, x=time_col, y='gaj', color='diabetes_status',
-        color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']},
-        markers=True
-    )
-    fig1.update_layout(xaxis_title="Period", yaxis_title="Average Fasting Glucose (mg/dL)",
-                       legend_title="Status", plot_bgcolor='white', height=350)
-    
-    hba1c_data = filtered_df.groupby([time_col, 'diabetes_status'])['hba1c'].mean().reset_index()
-    fig2 = px.line(
-        hba1c_data, x=time_col, y='hba1c', color='diabetes_status',
-        color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']},
-        markers=True
-    )
-    fig2.update_layout(xaxis_title="Period", yaxis_title="Average HbA1c (%)",
-                       legend_title="Status", plot_bgcolor='white', height=350)
+    return build_temporal(diabetes_status, age_group, period)
+
+@cache.memoize(make_name=versioned_name)
+def build_temporal(diabetes_status, age_group, period):
+    time_col, gaj_data, hba1c_data, combined_data = store.temporal_cache[(diabetes_status, age_group, period)]
     
-    combined_data = filtered_df.groupby(time_col).agg({
-        'gaj': 'mean', 'hba1c': 'mean', 'bmi': 'mean'
-    }).reset_index()
-    combined_data['bmi'] = combined_data['bmi'] * 10000
+    fig1 = status_lines(gaj_data, time_col, 'gaj', "Average Fasting Glucose (mg/dL)")
+    fig2 = status_lines(hba1c_data, time_col, 'hba1c', "Average HbA1c (%)")
     
     fig3 = make_subplots(rows=1, cols=3, subplot_titles=('Average GAJ', 'Average HbA1c', 'Average BMI'))
     
@@ -974,6 +1336,35 @@ def update_temporal(diabetes_status, age_group, period):
 
 # ========== CORRELATIONS PAGE CALLBACKS ==========
 
+def status_scatter(filtered_df, x_col, y_col):
+    # WebGL scatter with one trace per diabetes status
+    statuses = filtered_df['type_diabete'].to_numpy()
+    fig = go.Figure()
+    for code, status in enumerate(STATUS_LABELS):
+        rows = statuses == code
+        fig.add_trace(go.Scattergl(
+            x=filtered_df[x_col].to_numpy(np.float32)[rows], y=filtered_df[y_col].to_numpy(np.float32)[rows],
+            mode='markers', name=status, marker=dict(color=COLORS[status.lower()], opacity=0.6)
+        ))
+    return fig
+
+def linear_fit(x, y):
+    """Least-squares slope and intercept of y on x (closed form), skipping NaN pairs.
+    Returns None when no line is defined (no valid pairs, or x is constant)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    if len(x) == 0:
+        return None
+    x_mean, y_mean = x.mean(), y.mean()
+    x_dev = x - x_mean
+    x_var = float(x_dev @ x_dev)
+    if x_var == 0:
+        return None
+    slope = float(x_dev @ (y - y_mean)) / x_var
+    return slope, float(y_mean - slope * x_mean)
+
 @callback(
     [Output('correlation-heatmap', 'figure'),
      Output('bmi-gaj-scatter', 'figure'),
@@ -983,42 +1374,35 @@ def update_temporal(diabetes_status, age_group, period):
      Input('age-group-filter-p3', 'value')]
 )
 def update_correlations(diabetes_status, age_group):
-    filtered_df = df.copy()
-    
-    if diabetes_status != 'all':
-        filtered_df = filtered_df[filtered_df['type_diabete'] == diabetes_status]
-    
-    if age_group != 'all':
-        filtered_df = filtered_df[filtered_df['age_group'].astype(str) == age_group]
+    return build_correlations(diabetes_status, age_group)
+
+@cache.memoize(make_name=versioned_name)
+def build_correlations(diabetes_status, age_group):
+    filtered_df = CORRELATION_FRAME.iloc[filter_indices(diabetes_status, age_group)]
     
-    corr_cols = ['age', 'taille', 'poids', 'bmi', 'gaj', 'hba1c', 'type_diabete']
-    corr_matrix = filtered_df[corr_cols].corr()
+    corr_values = store.corr_cache[(diabetes_status, age_group)]
     
     fig1 = go.Figure(data=go.Heatmap(
-        z=corr_matrix.values, x=corr_cols, y=corr_cols,
+        z=corr_values, x=CORR_COLS, y=CORR_COLS,
         colorscale='RdBu', zmid=0,
-        text=corr_matrix.values.round(2),
+        text=corr_values.round(2),
         texttemplate='%{text}', textfont={"size": 10},
         colorbar=dict(title="Correlation")
     ))
     fig1.update_layout(height=500, xaxis_title="Variables", yaxis_title="Variables")
     
     # BMI vs GAJ scatter
-    fig2 = px.scatter(
-        filtered_df, x='bmi_scaled', y='gaj', color='diabetes_status',
-        color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']},
-        opacity=0.6
-    )
+    fig2 = status_scatter(filtered_df, 'bmi_scaled', 'gaj')
     
     # Add manual trendlines for each group
     for status, color in [('Healthy', COLORS['healthy']), ('Diabetic', COLORS['diabetic'])]:
         df_status = filtered_df[filtered_df['diabetes_status'] == status]
-        if len(df_status) > 1:
-            z = np.polyfit(df_status['bmi_scaled'].dropna(), df_status['gaj'].dropna(), 1)
-            p = np.poly1d(z)
-            x_trend = np.linspace(df_status['bmi_scaled'].min(), df_status['bmi_scaled'].max(), 100)
+        fit = linear_fit(df_status['bmi_scaled'].to_numpy(), df_status['gaj'].to_numpy())
+        if fit is not None:
+            slope, intercept = fit
+            x_trend = np.linspace(df_status['bmi_scaled'].min(), df_status['bmi_scaled'].max(), 100, dtype=np.float32)
             fig2.add_trace(go.Scatter(
-                x=x_trend, y=p(x_trend),
+                x=x_trend, y=slope * x_trend + intercept,
                 mode='lines', name=f'{status} trend',
                 line=dict(color=color, dash='dash'),
                 showlegend=False
@@ -1028,21 +1412,17 @@ def update_correlations(diabetes_status, age_group):
                        legend_title="Status", plot_bgcolor='white', height=350)
     
     # Age vs HbA1c scatter
-    fig3 = px.scatter(
-        filtered_df, x='age', y='hba1c', color='diabetes_status',
-        color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']},
-        opacity=0.6
-    )
+    fig3 = status_scatter(filtered_df, 'age', 'hba1c')
     
     # Add manual trendlines for each group
     for status, color in [('Healthy', COLORS['healthy']), ('Diabetic', COLORS['diabetic'])]:
         df_status = filtered_df[filtered_df['diabetes_status'] == status]
-        if len(df_status) > 1:
-            z = np.polyfit(df_status['age'].dropna(), df_status['hba1c'].dropna(), 1)
-            p = np.poly1d(z)
-            x_trend = np.linspace(df_status['age'].min(), df_status['age'].max(), 100)
+        fit = linear_fit(df_status['age'].to_numpy(), df_status['hba1c'].to_numpy())
+        if fit is not None:
+            slope, intercept = fit
+            x_trend = np.linspace(df_status['age'].min(), df_status['age'].max(), 100, dtype=np.float32)
             fig3.add_trace(go.Scatter(
-                x=x_trend, y=p(x_trend),
+                x=x_trend, y=slope * x_trend + intercept,
                 mode='lines', name=f'{status} trend',
                 line=dict(color=color, dash='dash'),
                 showlegend=False
@@ -1051,10 +1431,14 @@ def update_correlations(diabetes_status, age_group):
     fig3.update_layout(xaxis_title="Age (years)", yaxis_title="HbA1c (%)",
                        legend_title="Status", plot_bgcolor='white', height=350)
     
-    melted_df = filtered_df.melt(
-        id_vars=['diabetes_status'], value_vars=['gaj', 'hba1c'],
-        var_name='Indicator', value_name='Value'
-    )
+    # Long form of gaj/hba1c by status, built directly instead of via melt
+    status = filtered_df['diabetes_status']
+    melted_df = pd.DataFrame({
+        'diabetes_status': pd.Categorical.from_codes(np.tile(status.cat.codes.to_numpy(), 2), dtype=status.dtype),
+        'Indicator': np.repeat(np.array(['gaj', 'hba1c']), len(filtered_df)),
+        'Value': np.concatenate([filtered_df['gaj'].to_numpy(np.float32),
+                                 filtered_df['hba1c'].to_numpy(np.float32)]),
+    })
     fig4 = px.box(melted_df, x='Indicator', y='Value', color='diabetes_status',
                   color_discrete_map={'Healthy': COLORS['healthy'], 'Diabetic': COLORS['diabetic']})
     fig4.update_layout(xaxis_title="Clinical Indicator", yaxis_title="Value",
@@ -1074,6 +1458,14 @@ def update_correlations(diabetes_status, age_group):
     [Input('url', 'pathname')]
 )
 def update_models(pathname):
+    if pathname != '/models':
+        return (no_update,) * 6
+    return build_models_figures()
+
+@lru_cache(maxsize=1)
+def build_models_figures():
+    # models_comparison is static, so the figures are built once and reused
+    
     # Table
     test_data = models_comparison[models_comparison['Set'] == 'Test'].copy()
     
@@ -1114,14 +1506,15 @@ def update_models(pathname):
     
     # Radar chart
     test_metrics = models_comparison[models_comparison['Set'] == 'Test']
+    metric_values = test_metrics[['accuracy', 'precision', 'recall', 'f1', 'roc_auc']].to_numpy()
     fig5 = go.Figure()
     
-    for idx, row in test_metrics.iterrows():
+    for name, values in zip(test_metrics['Model'].to_numpy(), metric_values):
         fig5.add_trace(go.Scatterpolar(
-            r=[row['accuracy'], row['precision'], row['recall'], row['f1'], row['roc_auc']],
+            r=values.tolist(),
             theta=['Accuracy', 'Precision', 'Recall', 'F1', 'ROC-AUC'],
             fill='toself',
-            name=row['Model']
+            name=name
         ))
     
     fig5.update_layout(
@@ -1140,6 +1533,11 @@ def update_models(pathname):
 
 # ========== ANOMALY PAGE CALLBACKS ==========
 
+# Score histogram edges: the iso score is binned in its 8-bit code space, 4 whole
+# codes per bin (non-integer edges would give uneven bins and periodic spikes)
+ISO_SCORE_Q_EDGES = np.arange(-0.5, 256, 4)
+OCSVM_SCORE_EDGES = np.histogram_bin_edges(anomaly_results['ocsvm_score'].dropna(), bins=50)
+
 @callback(
     [Output('iso-anomalies-count', 'children'),
      Output('ocsvm-anomalies-count', 'children'),
@@ -1150,31 +1548,42 @@ def update_models(pathname):
     [Input('url', 'pathname')]
 )
 def update_anomalies(pathname):
-    iso_count = len(anomaly_results[anomaly_results['iso_anomaly'] == 1])
-    ocsvm_count = len(anomaly_results[anomaly_results['ocsvm_anomaly'] == 1])
-    consensus_count = len(anomaly_results[anomaly_results['consensus_anomaly'] == 1])
-    
-    # Scatter plot
-    plot_df = df.copy()
-    plot_df['anomaly_type'] = 'Normal'
-    if 'iso_anomaly' in plot_df.columns:
-        plot_df.loc[plot_df['iso_anomaly'] == 1, 'anomaly_type'] = 'Anomaly'
+    if pathname != '/anomalies':
+        return (no_update,) * 6
+    return build_anomaly_outputs()
+
+@lru_cache(maxsize=1)
+def build_anomaly_outputs():
+    # Anomaly results are static, so counts and figures are built once and reused
+    anomaly_flags = anomaly_results[['iso_anomaly', 'ocsvm_anomaly', 'consensus_anomaly']].to_numpy()
+    iso_count, ocsvm_count, consensus_count = (anomaly_flags == 1).sum(axis=0).tolist()
     
-    fig1 = px.scatter(plot_df, x='bmi_scaled', y='gaj', color='anomaly_type',
-                      color_discrete_map={'Normal': COLORS['primary'], 'Anomaly': COLORS['anomaly']},
-                      opacity=0.6, hover_data=['age', 'hba1c'])
+    # Scatter plot (WebGL, one trace per anomaly type)
+    is_anomaly = df['iso_anomaly'].to_numpy() == 1
+    hover_values = df[['age', 'hba1c']].to_numpy(np.float32)
+    fig1 = go.Figure()
+    for label, rows, color in [('Normal', ~is_anomaly, COLORS['primary']),
+                               ('Anomaly', is_anomaly, COLORS['anomaly'])]:
+        fig1.add_trace(go.Scattergl(
+            x=df['bmi_scaled'].to_numpy(np.float32)[rows], y=df['gaj'].to_numpy(np.float32)[rows],
+            mode='markers', name=label, marker=dict(color=color, opacity=0.6),
+            customdata=hover_values[rows],
+            hovertemplate="BMI=%{x}<br>GAJ=%{y}<br>Age=%{customdata[0]}<br>HbA1c=%{customdata[1]}"
+        ))
     fig1.update_layout(xaxis_title="BMI", yaxis_title="Fasting Glucose (mg/dL)",
                        legend_title="Type", height=400)
     
     # Iso score distribution
-    fig2 = px.histogram(anomaly_results, x='iso_score', nbins=50, 
-                        color_discrete_sequence=[COLORS['warning']])
-    fig2.update_layout(xaxis_title="Isolation Forest Score", yaxis_title="Count", height=300)
+    fig2 = go.Figure(histogram_bar(anomaly_results['iso_score_q'].to_numpy(), ISO_SCORE_Q_EDGES,
+                                   marker_color=COLORS['warning']))
+    iso_ticks = np.linspace(0, 255, 6)
+    fig2.update_xaxes(tickvals=iso_ticks, ticktext=[f"{ISO_SCORE_LO + t * ISO_SCORE_STEP:.2f}" for t in iso_ticks])
+    fig2.update_layout(xaxis_title="Isolation Forest Score", yaxis_title="Count", bargap=0, height=300)
     
     # OCSVM score distribution
-    fig3 = px.histogram(anomaly_results, x='ocsvm_score', nbins=50,
-                        color_discrete_sequence=[COLORS['danger']])
-    fig3.update_layout(xaxis_title="One-Class SVM Score", yaxis_title="Count", height=300)
+    fig3 = go.Figure(histogram_bar(anomaly_results['ocsvm_score'].to_numpy(), OCSVM_SCORE_EDGES,
+                                   marker_color=COLORS['danger']))
+    fig3.update_layout(xaxis_title="One-Class SVM Score", yaxis_title="Count", bargap=0, height=300)
     
     return iso_count, ocsvm_count, consensus_count, fig1, fig2, fig3
 
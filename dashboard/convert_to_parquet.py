@@ -0,0 +1,21 @@
+"""
+Diabetes Risk Prediction - Dashboard Data Conversion
+One-time conversion of the dashboard CSV sources to Parquet (zstd)
+"""
+
+import pandas as pd
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+
+SOURCES = [
+    BASE_DIR / 'data' / 'BASEDIABET.csv',
+    BASE_DIR / 'reports' / 'all_models_comparison.csv',
+    BASE_DIR / 'reports' / 'anomaly_detection_results.csv',
+]
+
+if __name__ == '__main__':
+    for csv_path in SOURCES:
+        parquet_path = csv_path.with_suffix('.parquet')
+        pd.read_csv(csv_path).to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+        print(f"{csv_path.name} -> {parquet_path.name}")